@@ -1,13 +1,36 @@
 import os
-import glob
+import sys
+from collections import defaultdict
+from multiprocessing import Pool
+
+from source_files import find_source_files
+
+# Line prefixes of single-line comments: JS/TS //, multiline continuation *, HTML <!--, SCSS/SASS #
+COMMENT_LINE_PREFIXES = ('//', '*', '<!--', '#')
+
+# Report file type by lowercase extension (without the dot)
+FILE_TYPES_BY_EXTENSION = {
+    'html': 'HTML',
+    'css': 'CSS',
+    'scss': 'SCSS',
+    'sass': 'SASS',
+    'js': 'JavaScript',
+    'ts': 'TypeScript'
+}
 
 def analyze_file_length(file_path):
     """
     Analyze file lengths for HTML, CSS, SCSS, SASS, JS, TS files
     """
     try:
+        # Read the whole file at once and split it, instead of readlines()
         with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+            content = f.read()
+        
+        lines = content.split('\n')
+        # A trailing newline ends the last line rather than starting a new one
+        if lines[-1] == '':
+            lines.pop()
         
         total_lines = len(lines)
         
@@ -30,7 +53,7 @@ def analyze_file_length(file_path):
                 continue
             
             # Check for multiline comment start (but not JSDoc)
-            elif stripped.startswith('/*') and not stripped.startswith('/**'):
+            elif stripped.startswith('/*'):
                 in_multiline_comment = True
                 comment_lines += 1
                 continue
@@ -54,10 +77,7 @@ def analyze_file_length(file_path):
                 comment_lines += 1
             
             # Single line comments and other comment types
-            elif (stripped.startswith('//') or  # JS/TS single line comments
-                  stripped.startswith('*') or   # continuation of multiline comments
-                  stripped.startswith('<!--') or  # HTML comments
-                  stripped.startswith('#')):    # SCSS/SASS comments
+            elif stripped.startswith(COMMENT_LINE_PREFIXES):
                 comment_lines += 1
         
         # Calculate code lines (non-empty, non-comment, non-jsdoc)
@@ -79,65 +99,32 @@ def analyze_file_length(file_path):
 
 def get_file_type(file_path):
     """Get the file type based on extension"""
-    extension = os.path.splitext(file_path)[1].lower()
-    type_mapping = {
-        '.html': 'HTML',
-        '.css': 'CSS',
-        '.scss': 'SCSS',
-        '.sass': 'SASS',
-        '.js': 'JavaScript',
-        '.ts': 'TypeScript'
-    }
-    return type_mapping.get(extension, 'Unknown')
+    extension = file_path.rpartition('.')[2].lower()
+    return FILE_TYPES_BY_EXTENSION.get(extension, 'Unknown')
 
 def scan_all_files():
     """Scan all HTML, CSS, SCSS, SASS, JS, TS files for length analysis"""
     # Get the directory where this script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
-    # Define file patterns to search for
-    file_patterns = [
-        "**/*.html",
-        "**/*.css", 
-        "**/*.scss",
-        "**/*.sass",
-        "**/*.js",
-        "**/*.ts"
-    ]
-    
-    # Collect all files
-    all_files = []
-    for pattern in file_patterns:
-        full_pattern = os.path.join(script_dir, pattern)
-        files = glob.glob(full_pattern, recursive=True)
-        all_files.extend(files)
-    
-    # Filter out unwanted directories
+    # Search for all supported extensions in one walk from the script directory,
+    # skipping node_modules and other unwanted directories without walking them
     excluded_dirs = ['node_modules', '.git', 'dist', 'build', '.angular', 'coverage', '.vscode', '.idea']
-    files = []
-    for file_path in all_files:
-        # Check if file contains any excluded directory in its path
-        should_exclude = any(excluded_dir in file_path for excluded_dir in excluded_dirs)
-        if not should_exclude:
-            files.append(file_path)
+    files = sorted(find_source_files(script_dir, ('.html', '.css', '.scss', '.sass', '.js', '.ts'), frozenset(excluded_dirs)))
     
-    # Group files by type
-    files_by_type = {
-        'HTML': [f for f in files if f.endswith('.html')],
-        'CSS': [f for f in files if f.endswith('.css')],
-        'SCSS': [f for f in files if f.endswith('.scss')],
-        'SASS': [f for f in files if f.endswith('.sass')],
-        'JavaScript': [f for f in files if f.endswith('.js')],
-        'TypeScript': [f for f in files if f.endswith('.ts')]
-    }
+    # Group files by type in a single pass
+    files_by_type = {file_type: [] for file_type in FILE_TYPES_BY_EXTENSION.values()}
+    for file_path in files:
+        files_by_type[get_file_type(file_path)].append(file_path)
     
     # Prepare output content
-    output_lines = []
-    output_lines.append("FILE LENGTH ANALYSIS REPORT")
-    output_lines.append(f"Generated: {os.popen('date /t').read().strip()} {os.popen('time /t').read().strip()}")
-    output_lines.append("=" * 80)
-    output_lines.append(f"Analyzing {len(files)} files for length > 400 lines...")
-    output_lines.append(f"Search directory: {script_dir}")
+    output_lines = [
+        "FILE LENGTH ANALYSIS REPORT",
+        f"Generated: {os.popen('date /t').read().strip()} {os.popen('time /t').read().strip()}",
+        "=" * 80,
+        f"Analyzing {len(files)} files for length > 400 lines...",
+        f"Search directory: {script_dir}",
+    ]
     
     # Display file counts by type
     for file_type, type_files in files_by_type.items():
@@ -146,39 +133,32 @@ def scan_all_files():
             print(count_msg)
             output_lines.append(count_msg)
     
-    output_lines.append(f"Excluded directories: {', '.join(excluded_dirs)}")
-    output_lines.append("")
+    output_lines.extend([f"Excluded directories: {', '.join(excluded_dirs)}", ""])
     print(f"Excluded directories: {', '.join(excluded_dirs)}")
     print("")
     
     all_large_files = []
     files_over_400 = 0
     
-    # Analyze each file
-    for file_path in files:
-        file_info = analyze_file_length(file_path)
+    with Pool() as pool:
+        results = pool.imap(analyze_file_length, files, chunksize=16)
+        file_results = list(zip(files, results))
+    
+    for file_path, file_info in file_results:
         if file_info and file_info['total_lines'] > 400:
             files_over_400 += 1
             all_large_files.append(file_info)
             
-            file_output = f"File: {file_path}"
-            separator = "-" * 80
-            
-            print(file_output)
-            print(separator)
-            output_lines.append(file_output)
-            output_lines.append(separator)
-            
-            details = f"  Type: {file_info['file_type']} | Total lines: {file_info['total_lines']}"
-            breakdown = f"  Non-empty: {file_info['non_empty_lines']} | Comments: {file_info['comment_lines']} | JSDoc: {file_info['jsdoc_lines']} | Code: {file_info['code_lines']}"
+            file_block = [
+                f"File: {file_path}",
+                "-" * 80,
+                f"  Type: {file_info['file_type']} | Total lines: {file_info['total_lines']}",
+                f"  Non-empty: {file_info['non_empty_lines']} | Comments: {file_info['comment_lines']} | JSDoc: {file_info['jsdoc_lines']} | Code: {file_info['code_lines']}",
+                "",
+            ]
             
-            print(details)
-            print(breakdown)
-            print("")
-            
-            output_lines.append(details)
-            output_lines.append(breakdown)
-            output_lines.append("")
+            sys.stdout.write('\n'.join(file_block) + '\n')
+            output_lines.extend(file_block)
     
     # Sort by total lines (largest first)
     all_large_files.sort(key=lambda x: x['total_lines'], reverse=True)
@@ -191,9 +171,7 @@ def scan_all_files():
     print(top_header)
     print(top_section)
     
-    output_lines.append(top_section)
-    output_lines.append(top_header)
-    output_lines.append(top_section)
+    output_lines.extend([top_section, top_header, top_section])
     
     for i, file_info in enumerate(all_large_files[:10]):
         rank_line = f"{i+1:2d}. {os.path.basename(file_info['file'])} ({file_info['total_lines']} lines)"
@@ -205,41 +183,39 @@ def scan_all_files():
         print(file_line)
         print("")
         
-        output_lines.append(rank_line)
-        output_lines.append(type_line)
-        output_lines.append(file_line)
-        output_lines.append("")
+        output_lines.extend([rank_line, type_line, file_line, ""])
     
     # Summary by file type
     summary_header = "=== SUMMARY BY FILE TYPE ==="
     print(summary_header)
     output_lines.append(summary_header)
     
-    type_summary = {}
+    # Per-type totals, created on first use
+    type_summary = defaultdict(lambda: {
+        'count': 0,
+        'total_lines': 0,
+        'max_lines': 0,
+        'files': []
+    })
     for file_info in all_large_files:
-        file_type = file_info['file_type']
-        if file_type not in type_summary:
-            type_summary[file_type] = {
-                'count': 0,
-                'total_lines': 0,
-                'max_lines': 0,
-                'files': []
-            }
-        type_summary[file_type]['count'] += 1
-        type_summary[file_type]['total_lines'] += file_info['total_lines']
-        type_summary[file_type]['max_lines'] = max(type_summary[file_type]['max_lines'], file_info['total_lines'])
-        type_summary[file_type]['files'].append(file_info)
+        data = type_summary[file_info['file_type']]
+        data['count'] += 1
+        data['total_lines'] += file_info['total_lines']
+        data['max_lines'] = max(data['max_lines'], file_info['total_lines'])
+        data['files'].append(file_info)
     
-    for file_type in ['HTML', 'CSS', 'SCSS', 'SASS', 'JavaScript', 'TypeScript']:
+    type_lines = []
+    for file_type in FILE_TYPES_BY_EXTENSION.values():
         if file_type in type_summary:
             data = type_summary[file_type]
             avg_lines = data['total_lines'] / data['count']
             type_line = f"{file_type}: {data['count']} files > 400 lines (avg: {avg_lines:.1f}, max: {data['max_lines']})"
         else:
             type_line = f"{file_type}: 0 files > 400 lines"
-        
-        print(type_line)
-        output_lines.append(type_line)
+        type_lines.append(type_line)
+    
+    print('\n'.join(type_lines))
+    output_lines.extend(type_lines)
     
     # Overall summary
     overall_header = "\n=== OVERALL SUMMARY ==="
@@ -250,9 +226,7 @@ def scan_all_files():
     print(files_analyzed)
     print(files_over_limit)
     
-    output_lines.append(overall_header)
-    output_lines.append(files_analyzed)
-    output_lines.append(files_over_limit)
+    output_lines.extend([overall_header, files_analyzed, files_over_limit])
     
     if files_over_400 == 0:
         no_large_files_msg = "No files longer than 400 lines found!"
@@ -267,8 +241,7 @@ def scan_all_files():
         print(avg_msg)
         print(largest_msg)
         
-        output_lines.append(avg_msg)
-        output_lines.append(largest_msg)
+        output_lines.extend([avg_msg, largest_msg])
         
         # Recommendations
         recommendations = [
@@ -279,9 +252,8 @@ def scan_all_files():
             "• JS/TS files > 400 lines: Split into smaller modules or services"
         ]
         
-        for rec in recommendations:
-            print(rec)
-            output_lines.append(rec)
+        print('\n'.join(recommendations))
+        output_lines.extend(recommendations)
     
     # Write to file
     output_file = "file_length_analysis.txt"
@@ -1,46 +1,92 @@
 import os
 import re
-import glob
+import sys
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import accumulate
+from multiprocessing import Pool
+
+from source_files import find_source_files, read_source_file
+
+# Method name patterns, compiled once instead of on every declaration.
+# The generic pattern also matches async/private/public/protected/static/get/set
+# declarations, so keyword-specific patterns after it could never match first.
+METHOD_NAME_PATTERNS = [re.compile(pattern) for pattern in (
+    r'function\s+(\w+)\s*\(',  # function methodName(
+    r'(\w+)\s*\(',  # methodName(
+)]
+
+# Line prefixes that never start a method declaration (comments, JSDoc, exports, imports, decorators)
+NON_METHOD_PREFIXES = ('//', '*', '/*', 'export ', 'import ', '@')
+
+# Method types by leading keyword (no keyword is a prefix of another, so order is irrelevant)
+METHOD_TYPE_BY_PREFIX = {
+    'private': 'Private Method',
+    'public': 'Public Method',
+    'protected': 'Protected Method',
+    'static': 'Static Method',
+    'function': 'Function',
+    'async': 'Async Method',
+}
+METHOD_TYPE_PREFIX_LENGTHS = sorted({len(prefix) for prefix in METHOD_TYPE_BY_PREFIX})
+
+# Prefix tuples for the declaration checks, each tested with a single startswith call
+TEST_BLOCK_PREFIXES = ('describe(', 'it(', 'beforeEach(', 'afterEach(', 'beforeAll(', 'afterAll(')
+VARIABLE_DECLARATION_PREFIXES = ('const ', 'let ', 'var ')
+STATEMENT_PREFIXES = ('return ', 'this.') + VARIABLE_DECLARATION_PREFIXES
+LIFECYCLE_HOOK_PREFIXES = ('ngOnInit', 'ngOnDestroy', 'ngOnChanges', 'ngAfterViewInit',
+                           'ngAfterContentInit', 'ngAfterViewChecked', 'ngAfterContentChecked')
+
+# Substrings that mark a declaration as a lifecycle hook in the method type breakdown
+LIFECYCLE_HOOK_MARKERS = ('ngOnInit', 'ngOnDestroy', 'ngOnChanges', 'ngAfterView')
+
+# Modifiers that may sit alone on the line between a JSDoc block and its method
+ACCESS_MODIFIERS = frozenset({'public', 'private', 'protected', 'static', 'readonly'})
 
 def analyze_jsdoc_coverage(file_path):
     """
     Analyze JSDoc coverage for methods and functions in TypeScript and JavaScript files
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_source_file(file_path)
         
         lines = content.split('\n')
+        # Stripped lines and brace positions, computed once instead of per method scan:
+        # the running brace balance after each line, and the lines that open a brace
+        stripped_lines = [line.strip() for line in lines]
+        brace_counts = [(line.count('{'), line.count('}')) for line in lines]
+        brace_balance = list(accumulate(opens - closes for opens, closes in brace_counts))
+        opening_lines = [i for i, (opens, _) in enumerate(brace_counts) if opens]
         missing_jsdoc = []
         
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            stripped = line.strip()
+        # Only lines with a parenthesis or a constructor/lifecycle hook name can be
+        # declarations, so the detailed checks below run on those lines only
+        candidate_lines = [i for i, line in enumerate(lines)
+                           if '(' in line or 'constructor' in line or 'ngOn' in line or 'ngAfter' in line]
+        
+        next_line = 0
+        for i in candidate_lines:
+            # Skip lines inside the body of the last analyzed method
+            if i < next_line:
+                continue
+            
+            stripped = stripped_lines[i]
             
             # Skip empty lines, comments, and non-method lines
             if (not stripped or 
-                stripped.startswith('//') or 
-                stripped.startswith('*') or 
-                stripped.startswith('/*') or
-                stripped.startswith('export ') or
-                stripped.startswith('import ') or
-                stripped.startswith('@') or
+                stripped.startswith(NON_METHOD_PREFIXES) or
                 'interface' in stripped or
                 'enum' in stripped or
                 'type ' in stripped or
                 (stripped.startswith('class ') and '{' in stripped)):
-                i += 1
                 continue
             
             # Check for method/function declarations
-            if is_method_declaration(stripped, lines, i):
-                method_info = analyze_method_jsdoc(lines, i, file_path)
+            if is_method_declaration(stripped, stripped_lines, i):
+                method_info = analyze_method_jsdoc(stripped_lines, i, file_path, brace_balance, opening_lines)
                 if method_info and not method_info['has_jsdoc']:
                     missing_jsdoc.append(method_info)
-                i = method_info['end_line'] if method_info else i + 1
-            else:
-                i += 1
+                next_line = method_info['end_line'] if method_info else i + 1
         
         return missing_jsdoc
         
@@ -48,15 +94,10 @@ def analyze_jsdoc_coverage(file_path):
         print(f"Error processing {file_path}: {e}")
         return []
 
-def is_method_declaration(stripped, lines, i):
+def is_method_declaration(stripped, stripped_lines, i):
     """Check if this line is a method/function declaration"""
     # Skip test methods (describe, it, beforeEach, etc.)
-    if (stripped.startswith('describe(') or 
-        stripped.startswith('it(') or 
-        stripped.startswith('beforeEach(') or 
-        stripped.startswith('afterEach(') or
-        stripped.startswith('beforeAll(') or
-        stripped.startswith('afterAll(')):
+    if stripped.startswith(TEST_BLOCK_PREFIXES):
         return False
     
     # Skip arrow functions - they typically don't need JSDoc
@@ -64,18 +105,12 @@ def is_method_declaration(stripped, lines, i):
         return False
     
     # Skip variable declarations with method calls (const x = method(), let y = new Date(), etc.)
-    if (stripped.startswith('const ') or 
-        stripped.startswith('let ') or 
-        stripped.startswith('var ')) and '=' in stripped:
+    if stripped.startswith(VARIABLE_DECLARATION_PREFIXES) and '=' in stripped:
         return False
     
     # Skip method calls that are part of variable assignments or return statements
-    if (stripped.startswith('return ') or 
-        stripped.startswith('const ') or 
-        stripped.startswith('let ') or 
-        stripped.startswith('var ') or
+    if (stripped.startswith(STATEMENT_PREFIXES) or
         '= ' in stripped or
-        stripped.startswith('this.') or
         'Math.' in stripped or
         'console.' in stripped or
         'document.' in stripped or
@@ -88,7 +123,7 @@ def is_method_declaration(stripped, lines, i):
     if ('(' in stripped and ')' in stripped and 
         not stripped.endswith('{') and 
         not stripped.endswith(':') and
-        not (i + 1 < len(lines) and lines[i + 1].strip() == '{')):
+        not (i + 1 < len(stripped_lines) and stripped_lines[i + 1] == '{')):
         # This looks like a method call, not a declaration
         return False
     
@@ -99,27 +134,20 @@ def is_method_declaration(stripped, lines, i):
     # Regular method/function with parentheses and either : or {
     if ('(' in stripped and ')' in stripped and 
         ((':' in stripped and ('{' in stripped or 
-         (i + 1 < len(lines) and lines[i + 1].strip() == '{'))) or
-         stripped.startswith('async ') or
-         stripped.startswith('function '))):
+         (i + 1 < len(stripped_lines) and stripped_lines[i + 1] == '{'))) or
+         stripped.startswith(('async ', 'function ')))):
         return True
     
     # Angular lifecycle hooks
-    if (stripped.startswith('ngOnInit') or 
-        stripped.startswith('ngOnDestroy') or 
-        stripped.startswith('ngOnChanges') or
-        stripped.startswith('ngAfterViewInit') or
-        stripped.startswith('ngAfterContentInit') or
-        stripped.startswith('ngAfterViewChecked') or
-        stripped.startswith('ngAfterContentChecked')):
+    if stripped.startswith(LIFECYCLE_HOOK_PREFIXES):
         return True
     
     return False
 
-def analyze_method_jsdoc(lines, start_line, file_path):
+def analyze_method_jsdoc(stripped_lines, start_line, file_path, brace_balance, opening_lines):
     """Analyze a method for JSDoc documentation"""
     try:
-        method_line = lines[start_line].strip()
+        method_line = stripped_lines[start_line]
         
         # Extract method name
         method_name = extract_method_name(method_line)
@@ -127,35 +155,19 @@ def analyze_method_jsdoc(lines, start_line, file_path):
             return None
         
         # Check for JSDoc comment above the method
-        has_jsdoc = check_for_jsdoc(lines, start_line)
+        has_jsdoc = check_for_jsdoc(stripped_lines, start_line)
         
-        # Find method boundaries
-        brace_count = 0
-        method_started = False
+        # Find method boundaries: the body starts at the first line opening a brace and
+        # ends on the first line where the brace balance drops back to its level before
+        # the method (arrow functions never get here, is_method_declaration skips them)
         end_line = start_line
-        
-        i = start_line
-        while i < len(lines):
-            line = lines[i]
-            
-            # Count braces to find method boundaries
-            open_braces = line.count('{')
-            close_braces = line.count('}')
-            
-            if open_braces > 0:
-                method_started = True
-            
-            brace_count += open_braces - close_braces
-            
-            # Method ends when brace count returns to 0 or we hit a semicolon for arrow functions
-            if method_started and brace_count <= 0:
-                end_line = i
-                break
-            elif '=>' in method_line and ';' in line:
-                end_line = i
-                break
-            
-            i += 1
+        first_open = bisect_left(opening_lines, start_line)
+        if first_open < len(opening_lines):
+            balance_before = brace_balance[start_line - 1] if start_line > 0 else 0
+            for i in range(opening_lines[first_open], len(brace_balance)):
+                if brace_balance[i] <= balance_before:
+                    end_line = i
+                    break
         
         return {
             'file': file_path,
@@ -170,14 +182,14 @@ def analyze_method_jsdoc(lines, start_line, file_path):
     except Exception as e:
         return None
 
-def check_for_jsdoc(lines, method_line_index):
+def check_for_jsdoc(stripped_lines, method_line_index):
     """Check if there's a JSDoc comment above the method"""
     # Look backwards from the method line to find JSDoc
     i = method_line_index - 1
     
     # Skip empty lines and decorators
     while i >= 0:
-        line = lines[i].strip()
+        line = stripped_lines[i]
         
         # Empty line - continue looking
         if not line:
@@ -190,7 +202,7 @@ def check_for_jsdoc(lines, method_line_index):
             continue
         
         # Access modifier line - continue looking
-        if line in ['public', 'private', 'protected', 'static', 'readonly']:
+        if line in ACCESS_MODIFIERS:
             i -= 1
             continue
         
@@ -199,10 +211,10 @@ def check_for_jsdoc(lines, method_line_index):
             # Look backwards to find JSDoc start
             j = i
             while j >= 0:
-                jsdoc_line = lines[j].strip()
+                jsdoc_line = stripped_lines[j]
                 if jsdoc_line.startswith('/**'):
                     return True
-                if not (jsdoc_line.startswith('*') or jsdoc_line.startswith('/*') or not jsdoc_line):
+                if not (jsdoc_line.startswith(('*', '/*')) or not jsdoc_line):
                     break
                 j -= 1
             break
@@ -219,6 +231,8 @@ def check_for_jsdoc(lines, method_line_index):
     
     return False
 
+# Declaration lines like ngOnInit(): void { repeat across files, so results are cached
+@lru_cache(maxsize=4096)
 def extract_method_name(method_line):
     """Extract method name from declaration line"""
     # Constructor
@@ -226,50 +240,34 @@ def extract_method_name(method_line):
         return 'constructor'
     
     # Angular lifecycle hooks
-    for hook in ['ngOnInit', 'ngOnDestroy', 'ngOnChanges', 'ngAfterViewInit', 
-                'ngAfterContentInit', 'ngAfterViewChecked', 'ngAfterContentChecked']:
+    for hook in LIFECYCLE_HOOK_PREFIXES:
         if method_line.startswith(hook):
             return hook
     
     # Regular methods/functions
-    patterns = [
-        r'function\s+(\w+)\s*\(',  # function methodName(
-        r'(\w+)\s*\(',  # methodName(
-        r'async\s+(\w+)\s*\(',  # async methodName(
-        r'private\s+(\w+)\s*\(',  # private methodName(
-        r'public\s+(\w+)\s*\(',  # public methodName(
-        r'protected\s+(\w+)\s*\(',  # protected methodName(
-        r'static\s+(\w+)\s*\(',  # static methodName(
-        r'get\s+(\w+)\s*\(',  # get methodName(
-        r'set\s+(\w+)\s*\(',  # set methodName(
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, method_line)
+    for pattern in METHOD_NAME_PATTERNS:
+        match = pattern.search(method_line)
         if match:
-            return match.group(1)
+            # Names like onClick or getUser repeat a lot; intern them so records share one string
+            return sys.intern(match.group(1))
     
     return 'unknown_method'
 
+@lru_cache(maxsize=4096)
 def determine_method_type(method_line):
     """Determine the type of method for categorization"""
     if method_line.startswith('constructor'):
         return 'Constructor'
-    elif any(hook in method_line for hook in ['ngOnInit', 'ngOnDestroy', 'ngOnChanges', 'ngAfterView']):
+    elif any(hook in method_line for hook in LIFECYCLE_HOOK_MARKERS):
         return 'Lifecycle Hook'
-    elif method_line.startswith('private'):
-        return 'Private Method'
-    elif method_line.startswith('public'):
-        return 'Public Method'
-    elif method_line.startswith('protected'):
-        return 'Protected Method'
-    elif method_line.startswith('static'):
-        return 'Static Method'
-    elif method_line.startswith('function'):
-        return 'Function'
-    elif method_line.startswith('async'):
-        return 'Async Method'
-    elif 'get ' in method_line:
+    
+    # Keyword prefixes: one dict lookup per prefix length instead of a startswith chain
+    for length in METHOD_TYPE_PREFIX_LENGTHS:
+        method_type = METHOD_TYPE_BY_PREFIX.get(method_line[:length])
+        if method_type:
+            return method_type
+    
+    if 'get ' in method_line:
         return 'Getter'
     elif 'set ' in method_line:
         return 'Setter'
@@ -281,25 +279,14 @@ def scan_all_files_for_jsdoc():
     # Get the directory where this script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
-    # Search for both .ts and .js files recursively from script directory
-    ts_pattern = os.path.join(script_dir, "**", "*.ts")
-    js_pattern = os.path.join(script_dir, "**", "*.js")
-    
-    ts_files = glob.glob(ts_pattern, recursive=True)
-    js_files = glob.glob(js_pattern, recursive=True)
-    all_files = ts_files + js_files
-    
-    # Filter out node_modules and other unwanted directories
+    # Search for both .ts and .js files recursively from script directory,
+    # skipping node_modules and other unwanted directories without walking them
     excluded_dirs = ['node_modules', '.git', 'dist', 'build', '.angular', 'coverage', '.vscode', '.idea']
-    files = []
-    for file_path in all_files:
-        # Check if file contains any excluded directory in its path
-        should_exclude = any(excluded_dir in file_path for excluded_dir in excluded_dirs)
-        if not should_exclude:
-            files.append(file_path)
+    all_files = sorted(find_source_files(script_dir, ('.ts', '.js'), frozenset(excluded_dirs)))
     
-    ts_files_filtered = [f for f in files if f.endswith('.ts')]
-    js_files_filtered = [f for f in files if f.endswith('.js')]
+    ts_files_filtered = [f for f in all_files if f.endswith('.ts')]
+    js_files_filtered = [f for f in all_files if f.endswith('.js')]
+    files = ts_files_filtered + js_files_filtered
     
     # Prepare output content
     output_lines = []
@@ -323,34 +310,28 @@ def scan_all_files_for_jsdoc():
     all_missing_methods = []
     files_with_missing_jsdoc = 0
     
-    for file_path in files:
-        missing_methods = analyze_jsdoc_coverage(file_path)
+    # Files are independent, so analyze them across all cores (results keep file order)
+    with Pool() as pool:
+        results = pool.imap(analyze_jsdoc_coverage, files, chunksize=16)
+        file_results = list(zip(files, results))
+    
+    for file_path, missing_methods in file_results:
         if missing_methods:
             files_with_missing_jsdoc += 1
             all_missing_methods.extend(missing_methods)
             
-            file_output = f"File: {file_path}"
-            separator = "-" * 80
-            
-            print(file_output)
-            print(separator)
-            output_lines.append(file_output)
-            output_lines.append(separator)
-            
+            # Build the file's report block, then write it to stdout in a single call
+            file_block = [f"File: {file_path}", "-" * 80]
             for method in missing_methods:
-                method_info = f"  Method: {method['method_name']} (Line {method['start_line']})"
-                method_type = f"     Type: {method['method_type']}"
-                declaration = f"     Declaration: {method['declaration'][:70]}..."
-                
-                print(method_info)
-                print(method_type)
-                print(declaration)
-                print("")
-                
-                output_lines.append(method_info)
-                output_lines.append(method_type)
-                output_lines.append(declaration)
-                output_lines.append("")
+                file_block.extend([
+                    f"  Method: {method['method_name']} (Line {method['start_line']})",
+                    f"     Type: {method['method_type']}",
+                    f"     Declaration: {method['declaration'][:70]}...",
+                    "",
+                ])
+            
+            sys.stdout.write('\n'.join(file_block) + '\n')
+            output_lines.extend(file_block)
     
     # Group by method type
     methods_by_type = {}
@@ -1,31 +1,57 @@
 import os
 import re
-import glob
+import sys
+from functools import lru_cache
+from multiprocessing import Pool
+from typing import NamedTuple
+
+from source_files import find_source_files, read_source_file
+
+# Method name pattern, compiled once instead of on every declaration.
+# It also matches async/private/public/protected/static/get/set declarations,
+# since the name before '(' is found regardless of the keyword in front of it.
+METHOD_NAME_PATTERN = re.compile(r'(\w+)\s*\(')  # methodName(
+
+# Line prefixes of comments and JSDoc, checked in a single startswith call
+COMMENT_PREFIXES = ('//', '*', '/*')
+
+# Line prefixes that never start a method declaration
+NON_METHOD_PREFIXES = COMMENT_PREFIXES + ('export ', 'import ', '@')
+
+# Declarations recognized by name alone: constructor and Angular lifecycle hooks
+LIFECYCLE_HOOKS = ('ngOnInit', 'ngOnDestroy', 'ngOnChanges', 'ngAfterViewInit')
+CONSTRUCTOR_AND_HOOK_PREFIXES = ('constructor',) + LIFECYCLE_HOOKS
+
+class MethodInfo(NamedTuple):
+    """Location and size of a detected method"""
+    file: str
+    method_name: str
+    start_line: int
+    end_line: int
+    total_lines: int
+    code_lines: int
+    declaration: str
 
 def analyze_method_length(file_path):
     """
     Analyze method/function lengths in TypeScript and JavaScript files
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_source_file(file_path)
         
         lines = content.split('\n')
+        # Stripped lines and brace counts, computed once instead of per method scan
+        stripped_lines = [line.strip() for line in lines]
+        brace_counts = [(line.count('{'), line.count('}')) for line in lines]
         long_methods = []
         
         i = 0
         while i < len(lines):
-            line = lines[i]
-            stripped = line.strip()
+            stripped = stripped_lines[i]
             
             # Skip empty lines, comments, and non-method lines
             if (not stripped or 
-                stripped.startswith('//') or 
-                stripped.startswith('*') or 
-                stripped.startswith('/*') or
-                stripped.startswith('export ') or
-                stripped.startswith('import ') or
-                stripped.startswith('@') or
+                stripped.startswith(NON_METHOD_PREFIXES) or
                 'interface' in stripped or
                 'enum' in stripped or
                 (stripped.startswith('class ') and '{' in stripped)):
@@ -33,11 +59,11 @@ def analyze_method_length(file_path):
                 continue
             
             # Check for method/function declarations
-            if is_method_declaration(stripped, lines, i):
-                method_info = analyze_method_from_line(lines, i, file_path)
-                if method_info and method_info['code_lines'] > 14:
+            if is_method_declaration(stripped, stripped_lines, i):
+                method_info = analyze_method_from_line(stripped_lines, i, file_path, brace_counts)
+                if method_info and method_info.code_lines > 14:
                     long_methods.append(method_info)
-                i = method_info['end_line'] if method_info else i + 1
+                i = method_info.end_line if method_info else i + 1
             else:
                 i += 1
         
@@ -47,32 +73,28 @@ def analyze_method_length(file_path):
         print(f"Error processing {file_path}: {e}")
         return []
 
-def is_method_declaration(stripped, lines, i):
+def is_method_declaration(stripped, stripped_lines, i):
     """Check if this line is a method/function declaration"""
-    # Constructor
-    if stripped.startswith('constructor'):
+    # Constructor and Angular lifecycle hooks
+    if stripped.startswith(CONSTRUCTOR_AND_HOOK_PREFIXES):
         return True
     
-    # Regular method/function with parentheses and either : or {
-    if ('(' in stripped and ')' in stripped and 
-        ((':' in stripped and ('{' in stripped or 
-         (i + 1 < len(lines) and lines[i + 1].strip() == '{'))) or
-         stripped.startswith('async '))):
-        return True
+    # Most lines have no parentheses and are rejected here with one cheap check
+    if '(' not in stripped or ')' not in stripped:
+        return False
     
-    # Angular lifecycle hooks
-    if (stripped.startswith('ngOnInit') or 
-        stripped.startswith('ngOnDestroy') or 
-        stripped.startswith('ngOnChanges') or
-        stripped.startswith('ngAfterViewInit')):
+    # Regular method/function with parentheses and either : or {
+    if ((':' in stripped and ('{' in stripped or 
+         (i + 1 < len(stripped_lines) and stripped_lines[i + 1] == '{'))) or
+        stripped.startswith('async ')):
         return True
     
     return False
 
-def analyze_method_from_line(lines, start_line, file_path):
+def analyze_method_from_line(stripped_lines, start_line, file_path, brace_counts):
     """Analyze a method starting from a specific line"""
     try:
-        method_line = lines[start_line].strip()
+        method_line = stripped_lines[start_line]
         
         # Extract method name
         method_name = extract_method_name(method_line)
@@ -86,13 +108,11 @@ def analyze_method_from_line(lines, start_line, file_path):
         total_lines = 0
         
         i = start_line
-        while i < len(lines):
-            line = lines[i]
-            stripped = line.strip()
+        while i < len(stripped_lines):
+            stripped = stripped_lines[i]
             
             # Count braces to find method boundaries
-            open_braces = line.count('{')
-            close_braces = line.count('}')
+            open_braces, close_braces = brace_counts[i]
             
             if open_braces > 0:
                 method_started = True
@@ -104,24 +124,21 @@ def analyze_method_from_line(lines, start_line, file_path):
             
             # Count actual code lines (not empty, not comments, not just braces)
             if (method_started and stripped and 
-                not stripped.startswith('//') and 
-                not stripped.startswith('*') and 
-                not stripped.startswith('/*') and
-                stripped != '{' and 
-                stripped != '}'):
+                not stripped.startswith(COMMENT_PREFIXES) and
+                stripped not in ('{', '}')):
                 code_lines += 1
             
             # Method ends when brace count returns to 0
             if method_started and brace_count <= 0:
-                return {
-                    'file': file_path,
-                    'method_name': method_name,
-                    'start_line': start_line + 1,  # 1-based line numbers
-                    'end_line': i + 1,
-                    'total_lines': total_lines,
-                    'code_lines': code_lines,
-                    'declaration': method_line
-                }
+                return MethodInfo(
+                    file=file_path,
+                    method_name=method_name,
+                    start_line=start_line + 1,  # 1-based line numbers
+                    end_line=i + 1,
+                    total_lines=total_lines,
+                    code_lines=code_lines,
+                    declaration=method_line
+                )
             
             i += 1
         
@@ -130,6 +147,7 @@ def analyze_method_from_line(lines, start_line, file_path):
     except Exception as e:
         return None
 
+@lru_cache(maxsize=4096)
 def extract_method_name(method_line):
     """Extract method name from declaration line"""
     # Constructor
@@ -137,26 +155,14 @@ def extract_method_name(method_line):
         return 'constructor'
     
     # Angular lifecycle hooks
-    for hook in ['ngOnInit', 'ngOnDestroy', 'ngOnChanges', 'ngAfterViewInit']:
+    for hook in LIFECYCLE_HOOKS:
         if method_line.startswith(hook):
             return hook
     
     # Regular methods/functions
-    patterns = [
-        r'(\w+)\s*\(',  # methodName(
-        r'async\s+(\w+)\s*\(',  # async methodName(
-        r'private\s+(\w+)\s*\(',  # private methodName(
-        r'public\s+(\w+)\s*\(',  # public methodName(
-        r'protected\s+(\w+)\s*\(',  # protected methodName(
-        r'static\s+(\w+)\s*\(',  # static methodName(
-        r'get\s+(\w+)\s*\(',  # get methodName(
-        r'set\s+(\w+)\s*\(',  # set methodName(
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, method_line)
-        if match:
-            return match.group(1)
+    match = METHOD_NAME_PATTERN.search(method_line)
+    if match:
+        return sys.intern(match.group(1))
     
     return None
 
@@ -165,25 +171,14 @@ def scan_all_ts_files():
     # Get the directory where this script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
-    # Search for both .ts and .js files recursively from script directory
-    ts_pattern = os.path.join(script_dir, "**", "*.ts")
-    js_pattern = os.path.join(script_dir, "**", "*.js")
-    
-    ts_files = glob.glob(ts_pattern, recursive=True)
-    js_files = glob.glob(js_pattern, recursive=True)
-    all_files = ts_files + js_files
-    
-    # Filter out node_modules and other unwanted directories
+    # Search for both .ts and .js files recursively from script directory,
+    # skipping node_modules and other unwanted directories without walking them
     excluded_dirs = ['node_modules', '.git', 'dist', 'build', '.angular', 'coverage']
-    files = []
-    for file_path in all_files:
-        # Check if file contains any excluded directory in its path
-        should_exclude = any(excluded_dir in file_path for excluded_dir in excluded_dirs)
-        if not should_exclude:
-            files.append(file_path)
+    all_files = sorted(find_source_files(script_dir, ('.ts', '.js'), frozenset(excluded_dirs)))
     
-    ts_files_filtered = [f for f in files if f.endswith('.ts')]
-    js_files_filtered = [f for f in files if f.endswith('.js')]
+    ts_files_filtered = [f for f in all_files if f.endswith('.ts')]
+    js_files_filtered = [f for f in all_files if f.endswith('.js')]
+    files = ts_files_filtered + js_files_filtered
     
     # Prepare output content
     output_lines = []
@@ -207,37 +202,29 @@ def scan_all_ts_files():
     all_long_methods = []
     files_with_long_methods = 0
     
-    for file_path in files:
-        long_methods = analyze_method_length(file_path)
+    with Pool() as pool:
+        results = pool.imap(analyze_method_length, files, chunksize=16)
+        file_results = list(zip(files, results))
+    
+    for file_path, long_methods in file_results:
         if long_methods:
             files_with_long_methods += 1
             all_long_methods.extend(long_methods)
             
-            file_output = f"File: {file_path}"
-            separator = "-" * 80
-            
-            print(file_output)
-            print(separator)
-            output_lines.append(file_output)
-            output_lines.append(separator)
-            
+            file_block = [f"File: {file_path}", "-" * 80]
             for method in long_methods:
-                method_info = f"  Method: {method['method_name']} (Line {method['start_line']}-{method['end_line']})"
-                details = f"     Code lines: {method['code_lines']} | Total lines: {method['total_lines']}"
-                declaration = f"     Declaration: {method['declaration'][:70]}..."
-                
-                print(method_info)
-                print(details)
-                print(declaration)
-                print("")
-                
-                output_lines.append(method_info)
-                output_lines.append(details)
-                output_lines.append(declaration)
-                output_lines.append("")
+                file_block.extend([
+                    f"  Method: {method.method_name} (Line {method.start_line}-{method.end_line})",
+                    f"     Code lines: {method.code_lines} | Total lines: {method.total_lines}",
+                    f"     Declaration: {method.declaration[:70]}...",
+                    "",
+                ])
+            
+            sys.stdout.write('\n'.join(file_block) + '\n')
+            output_lines.extend(file_block)
     
     # Sort by code lines (longest first)
-    all_long_methods.sort(key=lambda x: x['code_lines'], reverse=True)
+    all_long_methods.sort(key=lambda x: x.code_lines, reverse=True)
     
     top_section = "=" * 80
     top_header = "=== TOP 10 LONGEST METHODS ==="
@@ -251,9 +238,9 @@ def scan_all_ts_files():
     output_lines.append(top_section)
     
     for i, method in enumerate(all_long_methods[:10]):
-        method_line = f"{i+1:2d}. {method['method_name']} ({method['code_lines']} lines)"
-        file_line = f"    File: {method['file']}"
-        line_line = f"    Line: {method['start_line']}-{method['end_line']}"
+        method_line = f"{i+1:2d}. {method.method_name} ({method.code_lines} lines)"
+        file_line = f"    File: {method.file}"
+        line_line = f"    Line: {method.start_line}-{method.end_line}"
         
         print(method_line)
         print(file_line)
@@ -285,10 +272,10 @@ def scan_all_ts_files():
         print(no_methods_msg)
         output_lines.append(no_methods_msg)
     else:
-        avg_length = sum(m['code_lines'] for m in all_long_methods) / len(all_long_methods)
-        longest = max(all_long_methods, key=lambda x: x['code_lines'])
+        avg_length = sum(m.code_lines for m in all_long_methods) / len(all_long_methods)
+        longest = max(all_long_methods, key=lambda x: x.code_lines)
         avg_msg = f"Average length: {avg_length:.1f} lines"
-        longest_msg = f"Longest method: {longest['method_name']} ({longest['code_lines']} lines)"
+        longest_msg = f"Longest method: {longest.method_name} ({longest.code_lines} lines)"
         recommendation = f"Consider refactoring methods longer than 20-25 lines"
         
         print(avg_msg)
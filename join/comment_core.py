@@ -0,0 +1,31 @@
+import mmap
+import os
+import re
+
+from source_files import find_source_files
+
+# Directories that never contain source files worth processing
+SKIPPED_DIRS = frozenset({'node_modules', 'dist', '.angular', '.git', 'coverage'})
+
+# Everything before the first // that is not inside a string literal, matched in one pass.
+# Group 1 ends where the comment starts; escaped quotes inside strings are skipped.
+LINE_COMMENT_PATTERN = re.compile(r'''((?:[^"'`/]|"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|`(?:[^`\\]|\\.)*`|/(?!/))*)//''')
+
+def find_comment_start(line):
+    """Return the index of the first // outside a string literal, or -1"""
+    match = LINE_COMMENT_PATTERN.match(line)
+    return match.end(1) if match else -1
+
+def contains_comment_marker(file_path):
+    """Check the raw bytes of a file for // or /* without decoding it"""
+    # Empty files cannot be mapped and contain no comments anyway
+    if os.path.getsize(file_path) == 0:
+        return False
+    
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(b'//') != -1 or mm.find(b'/*') != -1
+
+def find_ts_files(root):
+    """Yield TypeScript files below root without descending into skipped directories"""
+    return find_source_files(root, '.ts', SKIPPED_DIRS)
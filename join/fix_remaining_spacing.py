@@ -1,89 +1,90 @@
 import os
 import re
-import glob
+import sys
+from multiprocessing import Pool
+
+from comment_core import find_ts_files
+from source_files import write_source_file
 
 def fix_method_spacing(file_path):
     """
     Improved method spacing fix that handles edge cases better
+    Returns whether the file was updated and the log lines to print for it
     """
+    log_lines = []
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        original_content = content
         lines = content.split('\n')
-        modified_lines = []
+        stripped_lines = [line.strip() for line in lines]
         
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            stripped = line.strip()
-            
-            # Add current line
-            modified_lines.append(line)
-            
-            # Check if this line ends a method (closing brace at method level)
-            if stripped == '}' and i > 0:
-                # Look ahead to see if next non-empty line is a JSDoc comment
-                next_line_idx = i + 1
-                
-                # Skip existing empty lines
-                while next_line_idx < len(lines) and not lines[next_line_idx].strip():
-                    next_line_idx += 1
-                
-                # If next line exists and starts with /** (JSDoc comment)
-                if (next_line_idx < len(lines) and 
-                    lines[next_line_idx].strip().startswith('/**') and
-                    next_line_idx == i + 1):  # No blank line exists
-                    
-                    # Check if this is not the last closing brace of the class
-                    if not is_class_closing_brace(lines, i):
-                        modified_lines.append('')
-                        print(f"  Added blank line at line {i+1}")
-            
-            i += 1
+        # Index of the last non-empty line, found once instead of slicing per brace
+        last_content_index = len(lines) - 1
+        while last_content_index >= 0 and not stripped_lines[last_content_index]:
+            last_content_index -= 1
         
-        new_content = '\n'.join(modified_lines)
+        # First pass: only decide where blank lines are missing
+        missing_blank_lines = []
+        for i in range(1, len(lines) - 1):
+            # A closing brace at method level directly followed by a JSDoc comment
+            # has no blank line in between (a blank next line needs no fix)
+            if stripped_lines[i] == '}' and stripped_lines[i + 1].startswith('/**'):
+                # Check if this is not the last closing brace of the class
+                if not is_class_closing_brace(i, last_content_index):
+                    missing_blank_lines.append(i)
         
-        # Only write if content changed
-        if new_content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            print(f"✓ Updated: {file_path}")
-            return True
-        else:
-            print(f"- No changes: {file_path}")
-            return False
+        # Unchanged files (the common case on re-runs) never build the output
+        if not missing_blank_lines:
+            log_lines.append(f"- No changes: {file_path}")
+            return False, log_lines
+        
+        # Second pass: copy the lines, inserting the missing blank lines
+        modified_lines = []
+        copied_up_to = 0
+        for i in missing_blank_lines:
+            modified_lines.extend(lines[copied_up_to:i + 1])
+            modified_lines.append('')
+            log_lines.append(f"  Added blank line at line {i+1}")
+            copied_up_to = i + 1
+        modified_lines.extend(lines[copied_up_to:])
+        
+        write_source_file(file_path, '\n'.join(modified_lines))
+        log_lines.append(f"✓ Updated: {file_path}")
+        return True, log_lines
             
     except Exception as e:
-        print(f"✗ Error processing {file_path}: {e}")
-        return False
+        log_lines.append(f"✗ Error processing {file_path}: {e}")
+        return False, log_lines
 
-def is_class_closing_brace(lines, brace_index):
+def is_class_closing_brace(brace_index, last_content_index):
     """
     Check if this closing brace is the final closing brace of the class
     """
-    # Count remaining non-empty lines after this brace
-    remaining_lines = lines[brace_index + 1:]
-    non_empty_remaining = [line for line in remaining_lines if line.strip()]
-    
-    # If only whitespace remains, this is likely the class closing brace
-    return len(non_empty_remaining) == 0
+    # If only whitespace remains after this brace, this is likely the class closing brace
+    return brace_index >= last_content_index
 
 def process_all_ts_files():
     """Process all TypeScript files in src/app/ directory"""
-    pattern = os.path.join("src", "app", "**", "*.ts")
-    files = glob.glob(pattern, recursive=True)
+    files = sorted(find_ts_files(os.path.join("src", "app")))
     
     print(f"Found {len(files)} TypeScript files in src/app/")
     print("Processing files for missing blank lines after methods...\n")
     
     updated_count = 0
     
-    for file_path in files:
-        print(f"\nProcessing: {file_path}")
-        if fix_method_spacing(file_path):
-            updated_count += 1
+    # Workers return their log lines, which are written to stdout in file order with one call
+    output = []
+    with Pool() as pool:
+        results = pool.imap(fix_method_spacing, files, chunksize=16)
+        for file_path, (updated, log_lines) in zip(files, results):
+            output.append(f"\nProcessing: {file_path}")
+            output.extend(log_lines)
+            if updated:
+                updated_count += 1
+    
+    if output:
+        sys.stdout.write('\n'.join(output) + '\n')
     
     print(f"\n=== Summary ===")
     print(f"Processed: {len(files)} files")
@@ -1,6 +1,34 @@
 import os
-import glob
+import sys
 import re
+import mmap
+from multiprocessing import Pool
+
+from source_files import find_source_files, write_source_file
+
+# console.log patterns, compiled once for all files instead of on every call
+CONSOLE_LOG_CALL = re.compile(r'console\.log\s*\(')
+# Whole-line console.log statements remove the blank lines around them, as ^\s* and \s*$ did.
+# The match starts at the last non-blank character before those lines (kept via group 1)
+# rather than at every line start, so a blank run is scanned once instead of once per line;
+# the last alternative covers a statement directly after a previous match.
+LOG_LINE_START = r'(?:\A\s*|(\S[^\S\n]*\n)\s*|^\n?[^\S\n]*)'
+SINGLE_LINE_LOG = re.compile(LOG_LINE_START + r'console\.log\s*\([^)]*\);\s*$', re.MULTILINE)
+SINGLE_LINE_LOG_NO_SEMICOLON = re.compile(LOG_LINE_START + r'console\.log\s*\([^)]*\)\s*$', re.MULTILINE)
+CHAINED_LOG = re.compile(r'console\.log\s*\([^)]*\)\.')
+# Four or more newlines separated only by other whitespace
+EXCESS_BLANK_LINES = re.compile(r'\n(?:[^\S\n]*\n){3,}')
+
+def contains_console_log(file_path):
+    """
+    Check the raw bytes of a file for console.log without decoding it
+    """
+    if os.path.getsize(file_path) == 0:
+        return False
+    
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(b'console.log') != -1
 
 def remove_console_logs_from_file(file_path):
     """
@@ -8,13 +36,18 @@ def remove_console_logs_from_file(file_path):
     Handles various console.log patterns while preserving code structure
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Most files have no console.log at all, so only read and decode
+        # the ones whose raw bytes contain it
+        if contains_console_log(file_path):
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        else:
+            content = ''
         
         original_content = content
         
         # Count original console.log occurrences for reporting
-        original_count = len(re.findall(r'console\.log\s*\(', content))
+        original_count = len(CONSOLE_LOG_CALL.findall(content))
         
         if original_count == 0:
             return {
@@ -27,10 +60,10 @@ def remove_console_logs_from_file(file_path):
         
         # Pattern 1: Simple single-line console.log statements
         # Matches: console.log('message'); or console.log(variable);
-        content = re.sub(r'^\s*console\.log\s*\([^)]*\);\s*$', '', content, flags=re.MULTILINE)
+        content = SINGLE_LINE_LOG.sub(r'\1', content)
         
         # Pattern 2: Console.log without semicolon at end of line
-        content = re.sub(r'^\s*console\.log\s*\([^)]*\)\s*$', '', content, flags=re.MULTILINE)
+        content = SINGLE_LINE_LOG_NO_SEMICOLON.sub(r'\1', content)
         
         # Pattern 3: Console.log with complex parameters (template literals, function calls, etc.)
         # This handles multiline console.log with balanced parentheses
@@ -41,10 +74,10 @@ def remove_console_logs_from_file(file_path):
             
             while i < len(lines):
                 line = lines[i]
-                stripped = line.strip()
+                stripped = line.lstrip()
                 
-                # Check if line starts with console.log
-                if re.match(r'^\s*console\.log\s*\(', line):
+                # Check if line starts with console.log( - plain prefix checks, no regex per line
+                if stripped.startswith('console.log') and stripped[11:].lstrip().startswith('('):
                     # Count parentheses to find the complete statement
                     paren_count = 0
                     log_lines = []
@@ -55,11 +88,7 @@ def remove_console_logs_from_file(file_path):
                         log_lines.append(current_line)
                         
                         # Count parentheses in this line
-                        for char in current_line:
-                            if char == '(':
-                                paren_count += 1
-                            elif char == ')':
-                                paren_count -= 1
+                        paren_count += current_line.count('(') - current_line.count(')')
                         
                         # If parentheses are balanced and we found at least one opening paren
                         if paren_count == 0 and len(log_lines) > 0:
@@ -87,20 +116,19 @@ def remove_console_logs_from_file(file_path):
         
         # Pattern 5: Console.log with chained methods
         # Remove: console.log().someMethod() -> .someMethod()
-        content = re.sub(r'console\.log\s*\([^)]*\)\.', '', content)
+        content = CHAINED_LOG.sub('', content)
         
         # Clean up excessive empty lines (more than 2 consecutive empty lines)
-        content = re.sub(r'\n\s*\n\s*\n\s*\n+', '\n\n\n', content)
+        content = EXCESS_BLANK_LINES.sub('\n\n\n', content)
         
         # Count remaining console.log occurrences
-        remaining_count = len(re.findall(r'console\.log\s*\(', content))
+        remaining_count = len(CONSOLE_LOG_CALL.findall(content))
         removed_count = original_count - remaining_count
         
         # Only write back if content changed
         modified = content != original_content
         if modified:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_source_file(file_path, content)
         
         return {
             'file': file_path,
@@ -128,35 +156,19 @@ def scan_and_remove_console_logs():
     # Get the directory where this script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
-    # Define file patterns to search for
-    file_patterns = [
-        "**/*.js",
-        "**/*.ts"
-    ]
-    
-    # Collect all files
-    all_files = []
-    for pattern in file_patterns:
-        full_pattern = os.path.join(script_dir, pattern)
-        files = glob.glob(full_pattern, recursive=True)
-        all_files.extend(files)
-    
-    # Filter out unwanted directories
+    # Search for .js and .ts files in one walk from the script directory,
+    # skipping node_modules and other unwanted directories without walking them
     excluded_dirs = ['node_modules', '.git', 'dist', 'build', '.angular', 'coverage', '.vscode', '.idea']
-    files = []
-    for file_path in all_files:
-        # Check if file contains any excluded directory in its path
-        should_exclude = any(excluded_dir in file_path for excluded_dir in excluded_dirs)
-        if not should_exclude:
-            files.append(file_path)
+    files = sorted(find_source_files(script_dir, ('.js', '.ts'), frozenset(excluded_dirs)))
     
     # Prepare output content
-    output_lines = []
-    output_lines.append("CONSOLE.LOG REMOVAL REPORT")
-    output_lines.append(f"Generated: {os.popen('date /t').read().strip()} {os.popen('time /t').read().strip()}")
-    output_lines.append("=" * 80)
-    output_lines.append(f"Analyzing {len(files)} JavaScript/TypeScript files for console.log removal...")
-    output_lines.append(f"Search directory: {script_dir}")
+    output_lines = [
+        "CONSOLE.LOG REMOVAL REPORT",
+        f"Generated: {os.popen('date /t').read().strip()} {os.popen('time /t').read().strip()}",
+        "=" * 80,
+        f"Analyzing {len(files)} JavaScript/TypeScript files for console.log removal...",
+        f"Search directory: {script_dir}",
+    ]
     
     # Display file counts by type
     js_files = [f for f in files if f.endswith('.js')]
@@ -167,11 +179,9 @@ def scan_and_remove_console_logs():
     
     print(js_count_msg)
     print(ts_count_msg)
-    output_lines.append(js_count_msg)
-    output_lines.append(ts_count_msg)
+    output_lines.extend([js_count_msg, ts_count_msg])
     
-    output_lines.append(f"Excluded directories: {', '.join(excluded_dirs)}")
-    output_lines.append("")
+    output_lines.extend([f"Excluded directories: {', '.join(excluded_dirs)}", ""])
     print(f"Excluded directories: {', '.join(excluded_dirs)}")
     print("")
     
@@ -183,14 +193,18 @@ def scan_and_remove_console_logs():
     files_with_errors = 0
     files_with_logs = []
     
-    for file_path in files:
-        print(f"Processing: {os.path.basename(file_path)}")
-        result = remove_console_logs_from_file(file_path)
+    with Pool() as pool:
+        results = pool.imap(remove_console_logs_from_file, files, chunksize=16)
+        file_results = list(zip(files, results))
+    
+    progress_lines = []
+    for file_path, result in file_results:
+        progress_lines.append(f"Processing: {os.path.basename(file_path)}")
         
         if result['error']:
             files_with_errors += 1
             error_msg = f"ERROR processing {file_path}: {result['error']}"
-            print(error_msg)
+            progress_lines.append(error_msg)
             output_lines.append(error_msg)
             continue
         
@@ -207,21 +221,19 @@ def scan_and_remove_console_logs():
             file_output = f"File: {file_path}"
             separator = "-" * 80
             
-            output_lines.append(file_output)
-            output_lines.append(separator)
+            output_lines.extend([file_output, separator])
             
             stats = f"  Original console.logs: {result['original_logs']}"
             removed = f"  Removed: {result['removed_logs']}"
             remaining = f"  Remaining: {result['remaining_logs']}"
             status = f"  Status: {'Modified' if result['modified'] else 'No changes needed'}"
             
-            print(f"  {os.path.basename(file_path)}: {result['original_logs']} -> {result['remaining_logs']} console.logs")
+            progress_lines.append(f"  {os.path.basename(file_path)}: {result['original_logs']} -> {result['remaining_logs']} console.logs")
             
-            output_lines.append(stats)
-            output_lines.append(removed)
-            output_lines.append(remaining)
-            output_lines.append(status)
-            output_lines.append("")
+            output_lines.extend([stats, removed, remaining, status, ""])
+    
+    if progress_lines:
+        sys.stdout.write('\n'.join(progress_lines) + '\n')
     
     # Sort files by number of original console.logs (most first)
     files_with_logs.sort(key=lambda x: x['original_logs'], reverse=True)
@@ -235,9 +247,7 @@ def scan_and_remove_console_logs():
         print(top_header)
         print(top_section)
         
-        output_lines.append(top_section)
-        output_lines.append(top_header)
-        output_lines.append(top_section)
+        output_lines.extend([top_section, top_header, top_section])
         
         for i, result in enumerate(files_with_logs[:10]):
             rank_line = f"{i+1:2d}. {os.path.basename(result['file'])} ({result['original_logs']} original, {result['removed_logs']} removed, {result['remaining_logs']} remaining)"
@@ -247,9 +257,7 @@ def scan_and_remove_console_logs():
             print(file_line)
             print("")
             
-            output_lines.append(rank_line)
-            output_lines.append(file_line)
-            output_lines.append("")
+            output_lines.extend([rank_line, file_line, ""])
     
     # Files with remaining console.logs (need manual review)
     files_with_remaining = [f for f in files_with_logs if f['remaining_logs'] > 0]
@@ -285,14 +293,16 @@ def scan_and_remove_console_logs():
     print(total_removed_msg)
     print(total_remaining_msg)
     
-    output_lines.append(summary_header)
-    output_lines.append(files_analyzed)
-    output_lines.append(files_with_logs_count)
-    output_lines.append(files_modified_count)
-    output_lines.append(files_errors)
-    output_lines.append(total_logs)
-    output_lines.append(total_removed_msg)
-    output_lines.append(total_remaining_msg)
+    output_lines.extend([
+        summary_header,
+        files_analyzed,
+        files_with_logs_count,
+        files_modified_count,
+        files_errors,
+        total_logs,
+        total_removed_msg,
+        total_remaining_msg,
+    ])
     
     if total_removed_logs == 0:
         no_logs_msg = "No console.log statements found to remove!"
@@ -319,9 +329,8 @@ def scan_and_remove_console_logs():
             "• Backup your files before running this script on important code"
         ]
         
-        for rec in recommendations:
-            print(rec)
-            output_lines.append(rec)
+        print('\n'.join(recommendations))
+        output_lines.extend(recommendations)
     
     # Write to file
     output_file = "console_log_removal_report.txt"
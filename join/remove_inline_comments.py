@@ -1,12 +1,20 @@
 import os
-import re
-import glob
+import sys
+from multiprocessing import Pool
+
+from comment_core import contains_comment_marker, find_comment_start, find_ts_files
+from source_files import write_source_file
 
 def remove_inline_comments(file_path):
     """
     Remove comments inside code blocks while preserving JSDoc comments
+    Returns the number of removed comments and the log line to print for the file
     """
     try:
+        # Files without any comment marker need no decoding or line-by-line pass at all
+        if not contains_comment_marker(file_path):
+            return 0, f"- No inline comments found in: {file_path}"
+        
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
@@ -16,29 +24,36 @@ def remove_inline_comments(file_path):
         
         in_jsdoc = False
         in_multiline_comment = False
+        # Whether the last kept line has content, tracked instead of re-stripping it
+        prev_nonempty = False
         
         for line in lines:
             original_line = line
+            # Stripped once per line and reused by every check below
+            stripped = line.strip()
             
             # Check if we're starting a JSDoc comment
-            if line.strip().startswith('/**'):
+            if stripped.startswith('/**'):
                 in_jsdoc = True
                 modified_lines.append(line)
+                prev_nonempty = True
                 continue
             
             # Check if we're ending a JSDoc comment
-            if in_jsdoc and (line.strip().endswith('*/') or line.strip() == '*/'):
+            if in_jsdoc and stripped.endswith('*/'):
                 in_jsdoc = False
                 modified_lines.append(line)
+                prev_nonempty = True
                 continue
             
             # Preserve JSDoc comments
             if in_jsdoc:
                 modified_lines.append(line)
+                prev_nonempty = bool(stripped)
                 continue
             
             # Check for multiline comments that are NOT JSDoc
-            if '/*' in line and not line.strip().startswith('/**'):
+            if '/*' in line and not stripped.startswith('/**'):
                 in_multiline_comment = True
                 # Remove the comment from this line
                 before_comment = line.split('/*')[0]
@@ -51,9 +66,11 @@ def remove_inline_comments(file_path):
                     line = before_comment
                 
                 # Only keep the line if it has non-whitespace content
-                if line.strip():
-                    modified_lines.append(line.rstrip())
-                if original_line != line.rstrip():
+                line = line.rstrip()
+                if line:
+                    modified_lines.append(line)
+                    prev_nonempty = True
+                if original_line != line:
                     changes_made += 1
                 continue
             
@@ -65,44 +82,26 @@ def remove_inline_comments(file_path):
                     after_comment = line.split('*/')[-1]
                     if after_comment.strip():
                         modified_lines.append(after_comment.rstrip())
+                        prev_nonempty = True
                 changes_made += 1
                 continue
             
             # Remove single line comments (//)
+            code = stripped
             if '//' in line:
-                # Check if // is inside a string
-                in_string = False
-                quote_char = None
-                i = 0
-                comment_index = -1
-                
-                while i < len(line):
-                    char = line[i]
-                    
-                    # Handle string literals
-                    if not in_string and (char == '"' or char == "'" or char == '`'):
-                        in_string = True
-                        quote_char = char
-                    elif in_string and char == quote_char and (i == 0 or line[i-1] != '\\'):
-                        in_string = False
-                        quote_char = None
-                    
-                    # Find // outside of strings
-                    elif not in_string and i < len(line) - 1 and line[i:i+2] == '//':
-                        comment_index = i
-                        break
-                    
-                    i += 1
-                
+                comment_index = find_comment_start(line)
                 if comment_index >= 0:
                     line = line[:comment_index].rstrip()
-                    if original_line.strip() != line.strip():
+                    code = line.lstrip()
+                    if stripped != code:
                         changes_made += 1
             
             # Only add non-empty lines or preserve indentation for empty lines in meaningful contexts
-            if line.strip() or (not line.strip() and len(modified_lines) > 0 and modified_lines[-1].strip()):
+            if code or prev_nonempty:
                 modified_lines.append(line)
-            elif original_line.strip() and not line.strip():
+                prev_nonempty = bool(code)
+            elif stripped:
+                # The line held nothing but a comment
                 changes_made += 1
         
         # Remove trailing empty lines but keep one empty line at the end if file had content
@@ -114,34 +113,35 @@ def remove_inline_comments(file_path):
         
         new_content = '\n'.join(modified_lines)
         
-        if changes_made > 0:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            print(f"✓ Removed {changes_made} inline comments from: {file_path}")
-            return changes_made
+        # Only write if content actually changed
+        if changes_made > 0 and new_content != content:
+            write_source_file(file_path, new_content)
+            return changes_made, f"✓ Removed {changes_made} inline comments from: {file_path}"
         else:
-            print(f"- No inline comments found in: {file_path}")
-            return 0
+            return 0, f"- No inline comments found in: {file_path}"
             
     except Exception as e:
-        print(f"✗ Error processing {file_path}: {e}")
-        return 0
+        return 0, f"✗ Error processing {file_path}: {e}"
 
 def process_all_ts_files():
     """Process all TypeScript files to remove inline comments"""
-    pattern = os.path.join("src", "app", "**", "*.ts")
-    files = glob.glob(pattern, recursive=True)
+    files = sorted(find_ts_files(os.path.join("src", "app")))
     
     print(f"Removing inline comments from {len(files)} TypeScript files...\n")
     
     total_removed = 0
     files_updated = 0
     
-    for file_path in files:
-        removed = remove_inline_comments(file_path)
-        if removed > 0:
-            files_updated += 1
-            total_removed += removed
+    output = []
+    with Pool() as pool:
+        for removed, log_line in pool.imap(remove_inline_comments, files, chunksize=16):
+            output.append(log_line)
+            if removed > 0:
+                files_updated += 1
+                total_removed += removed
+    
+    if output:
+        sys.stdout.write('\n'.join(output) + '\n')
     
     print(f"\n=== Summary ===")
     print(f"Files processed: {len(files)}")
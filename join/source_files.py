@@ -0,0 +1,45 @@
+import os
+import shutil
+
+# Read buffer reused for every file a (worker) process reads; grows to the largest file
+READ_BUFFER = bytearray(1 << 16)
+
+def read_source_file(file_path):
+    """Read a UTF-8 source file through the shared read buffer"""
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > len(READ_BUFFER):
+            READ_BUFFER.extend(bytes(size - len(READ_BUFFER)))
+        view = memoryview(READ_BUFFER)[:size]
+        bytes_read = f.readinto(view)
+        return str(view[:bytes_read], 'utf-8')
+
+def write_source_file(file_path, content):
+    """Replace a file's content via a temporary file, so a failed write never truncates the original"""
+    # Write next to the symlink target with the original mode, so links and permissions survive the swap
+    real_path = os.path.realpath(file_path)
+    temp_path = real_path + '.tmp'
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        shutil.copymode(real_path, temp_path)
+        os.replace(temp_path, real_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def find_source_files(root, extensions, excluded_dirs):
+    """Yield files with the given extensions below root, pruning excluded directories (a set of names)"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                # Hidden files and directories are skipped, as glob did
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in excluded_dirs:
+                        stack.append(entry.path)
+                elif entry.name.endswith(extensions):
+                    yield entry.path